@@ -1,4 +1,4 @@
 # Package marker for auth-related helpers
-from .osm import OSMAuthConfig, OSMClient
+from .osm import OSMAuthConfig, OSMClient, OSMClientSpec, parallel_map
 
-__all__ = ["OSMClient", "OSMAuthConfig"]
+__all__ = ["OSMClient", "OSMAuthConfig", "OSMClientSpec", "parallel_map"]
@@ -1,4 +1,5 @@
 from .client import OSMClient
 from .config import OSMAuthConfig
+from .pool import OSMClientSpec, parallel_map
 
-__all__ = ["OSMClient", "OSMAuthConfig"]
+__all__ = ["OSMClient", "OSMAuthConfig", "OSMClientSpec", "parallel_map"]
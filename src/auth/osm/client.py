@@ -41,6 +41,29 @@ class OSMClient(OAuth2Client):
             token_endpoint=self.cfg.token_url,
         )
 
+    def __reduce__(self):
+        """Pickle as config, token store, token and request settings.
+
+        The httpx connection pool is not pickled; `__setstate__` rebuilds it
+        through `OSMClient.__init__`, so subclasses with a different
+        constructor unpickle too.
+        """
+        state = {
+            "cfg": self.cfg,
+            "token_store": self.token_store,
+            "token": dict(self.token) if self.token else None,
+            "headers": dict(self.headers),
+            "timeout": self.timeout,
+        }
+        return (_new_client, (self.__class__,), state)
+
+    def __setstate__(self, state: dict) -> None:
+        OSMClient.__init__(self, config=state["cfg"], token_store=state["token_store"])
+        self.headers = state["headers"]
+        self.timeout = state["timeout"]
+        if state["token"]:
+            self.token = state["token"]  # type: ignore[attr-defined]
+
     def authorization_url(self) -> str:
         url, _ = self.create_authorization_url(self.cfg.authorize_url)
         return url
@@ -73,15 +96,21 @@ class OSMClient(OAuth2Client):
 
         return self.fetch_token_from_callback(callback_url)
 
-    def _token_is_valid(self, skew_seconds: int = 30) -> bool:
+    def _token_is_valid(
+        self, skew_seconds: int = 30, token: dict | None = None
+    ) -> bool:
         """Best-effort check for token validity based on expires_at.
 
-        If no expiry info is found, assume valid.
+        Checks `token` if given, otherwise the client's own token. If no
+        expiry info is found, assume valid.
         """
-        if not self.token:
+        token = self.token if token is None else token
+        if not token:
             return False
 
-        expires_at = self.token.get("expires_at", False)  # seconds since epoch
+        expires_at = token.get("expires_at")  # seconds since epoch
+        if expires_at is None:
+            return True
         if isinstance(expires_at, (int, float)):
             return (time.time() + skew_seconds) < float(expires_at)
 
@@ -93,18 +122,25 @@ class OSMClient(OAuth2Client):
         Does not open a browser or wait for callbacks. Returns None if no
         valid/refreshable token is available.
         """
-        # Prefer token currently on the client
-        token = getattr(self, "token", None)
-        if not token and self.token_store:
-            token = self.token_store.get_token()
-            if token:
-                self.token = token  # type: ignore[attr-defined]
-
         if self._token_is_valid():
             return self.token
 
-        # Attempt refresh if possible
-        if self.token and self.token.get("refresh_token"):
+        with self.token_store.lock():
+            # Load from the store, or re-read it under the lock in case
+            # another process sharing it has already refreshed
+            stored = self.token_store.get_token()
+            if stored and stored != self.token:
+                if self._token_is_valid(token=stored):
+                    self.token = stored  # type: ignore[attr-defined]
+                    return self.token
+                # Prefer a stored refresh token, which may have been rotated,
+                # but never drop a refreshable client token for a dead one
+                if stored.get("refresh_token") or not self.token:
+                    self.token = stored  # type: ignore[attr-defined]
+
+            if not (self.token and self.token.get("refresh_token")):
+                return None
+
             try:
                 self.refresh_token(
                     self.cfg.token_url, refresh_token=self.token["refresh_token"]
@@ -117,7 +153,28 @@ class OSMClient(OAuth2Client):
 
             return self.token
 
-        return None
+    def share_token(self) -> None:
+        """Persist the client's token for other processes sharing the store.
+
+        Leaves the store alone if it already holds a valid token, which may
+        be newer than this client's (e.g. refreshed by another job).
+        """
+        if not self.token:
+            return
+
+        with self.token_store.lock():
+            stored = self.token_store.get_token()
+            if stored and (stored == self.token or self._token_is_valid(token=stored)):
+                return
+            self.token_store.save_token(dict(self.token))
+
+    def ensure_active_token(self, token=None) -> bool:
+        """Refresh through the token store before authlib sends a request.
+
+        Overrides authlib's own expiry check, which would refresh without
+        the store lock and without persisting the new token.
+        """
+        return self.get_or_refresh_token() is not None
 
     def get_token(
         self,
@@ -151,3 +208,7 @@ class OSMClient(OAuth2Client):
             certfile=certfile,
             keyfile=keyfile,
         )
+
+
+def _new_client(cls: type[OSMClient]) -> OSMClient:
+    return cls.__new__(cls)
@@ -0,0 +1,137 @@
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, TypeVar
+
+from auth.osm.client import OSMClient
+from auth.osm.config import OSMAuthConfig
+from auth.token_store import TokenStore
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_NO_TOKEN_MESSAGE = (
+    "No valid token available; perform one interactive login to seed the "
+    "token store."
+)
+
+
+@dataclass
+class OSMClientSpec:
+    """Picklable recipe for building an `OSMClient` in another process.
+
+    Holds only the resolved config and token store, so it can be shipped to
+    worker processes without dragging along the live httpx client. The
+    client is built lazily on first use and cached per process; the token is
+    shared through the token store rather than copied into each worker.
+    """
+
+    config: OSMAuthConfig
+    token_store: TokenStore
+    _client: OSMClient | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _client_pid: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_client(cls, client: OSMClient) -> "OSMClientSpec":
+        return cls(config=client.cfg, token_store=client.token_store)
+
+    def client(self) -> OSMClient:
+        """Return this process's client, building it on first use.
+
+        A freshly built client loads its token from the store. A client
+        inherited from a forked parent is discarded and rebuilt, as its
+        connection pool belongs to the parent process.
+
+        Raises:
+            RuntimeError: If no valid or refreshable token is in the store.
+        """
+        if self._client is None or self._client_pid != os.getpid():
+            client = OSMClient(config=self.config, token_store=self.token_store)
+            if not client.get_or_refresh_token():
+                client.close()
+                raise RuntimeError(_NO_TOKEN_MESSAGE)
+            self._client = client
+            self._client_pid = os.getpid()
+        return self._client
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_client"] = None
+        state["_client_pid"] = None
+        return state
+
+
+_worker_spec: OSMClientSpec | None = None
+
+
+def _init_worker(spec: OSMClientSpec) -> None:
+    global _worker_spec
+    _worker_spec = spec
+
+
+def _call_in_worker(fn: Callable[[OSMClient, T], R], item: T) -> R:
+    if _worker_spec is None:
+        raise RuntimeError("OSM worker process was not initialised with a client spec")
+    return fn(_worker_spec.client(), item)
+
+
+def parallel_map(
+    client: OSMClient | OSMClientSpec,
+    fn: Callable[[OSMClient, T], R],
+    items: Iterable[T],
+    *,
+    max_workers: int | None = None,
+    chunksize: int = 1,
+    mp_context: multiprocessing.context.BaseContext | None = None,
+) -> list[R]:
+    """Run `fn(client, item)` for each item across a process pool.
+
+    The token is obtained (or refreshed) once in the parent and persisted to
+    the token store before any work is dispatched, so workers pick it up from
+    the store instead of each refreshing it. Each worker builds its own
+    client once and reuses it for every item it handles; if the token expires
+    mid-job, refreshes are serialised through the store's lock so only one
+    process refreshes it.
+
+    Args:
+        client: The client, or a spec for one, to replicate in each worker.
+        fn: A picklable (module-level) callable taking the worker's client
+            and one item.
+        items: The work items, e.g. section or member IDs.
+        max_workers: Number of worker processes; defaults to the CPU count.
+        chunksize: Items sent to a worker per task.
+        mp_context: Optional multiprocessing context (e.g. "spawn").
+
+    Returns:
+        The results of `fn`, in the same order as `items`.
+
+    Raises:
+        RuntimeError: If no valid or refreshable token is available.
+    """
+    if isinstance(client, OSMClientSpec):
+        spec = client
+        spec.client()
+    else:
+        if not client.get_or_refresh_token():
+            raise RuntimeError(_NO_TOKEN_MESSAGE)
+        # Workers load the token from the store, not from this client
+        client.share_token()
+        spec = OSMClientSpec.from_client(client)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(spec,),
+    ) as executor:
+        items = list(items)
+        logger.debug(f"Dispatching {len(items)} OSM work items to process pool")
+        return list(
+            executor.map(_call_in_worker, [fn] * len(items), items, chunksize=chunksize)
+        )
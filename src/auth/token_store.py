@@ -1,8 +1,14 @@
 import json
 import logging
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +30,14 @@ class TokenStore(ABC):
     def delete_token(self) -> None:  # pragma: no cover - interface
         pass
 
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold an exclusive lock around a read-refresh-save cycle.
+
+        A no-op by default; stores shared between processes override it.
+        """
+        yield
+
 
 class InMemoryTokenStore(TokenStore):
     """In-memory token store for testing or ephemeral use."""
@@ -80,6 +94,21 @@ class JsonTokenStore(TokenStore):
             # self.token_file_path.unlink(missing_ok=True)
             return None
 
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Holds an exclusive `flock` on a `.lock` file beside the token file."""
+        if fcntl is None:  # pragma: no cover - not available on Windows
+            yield
+            return
+
+        lock_path = self.token_file_path.with_name(self.token_file_path.name + ".lock")
+        with open(lock_path, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
     def delete_token(self) -> None:
         """Deletes the token file."""
         try:
@@ -0,0 +1,11 @@
+import pytest
+
+
+@pytest.fixture()
+def env_osm(monkeypatch):
+    monkeypatch.setenv("OSM_CLIENT_ID", "test-client-id")
+    monkeypatch.setenv("OSM_CLIENT_SECRET", "test-client-secret")
+    monkeypatch.setenv("OSM_REDIRECT_URI", "http://localhost:8000/osm/callback")
+    monkeypatch.setenv("OSM_SCOPES", "section:finance:read")
+    monkeypatch.setenv("BASE_URL", "https://example.osm.local")
+    monkeypatch.setenv("OSM_BANK_ACCOUNT_ID", "12345")
@@ -1,21 +1,9 @@
 import time
 
-import pytest
-
 from auth.osm import OSMAuthConfig, OSMClient
 from auth.token_store import InMemoryTokenStore
 
 
-@pytest.fixture()
-def env_osm(monkeypatch):
-    monkeypatch.setenv("OSM_CLIENT_ID", "test-client-id")
-    monkeypatch.setenv("OSM_CLIENT_SECRET", "test-client-secret")
-    monkeypatch.setenv("OSM_REDIRECT_URI", "http://localhost:8000/osm/callback")
-    monkeypatch.setenv("OSM_SCOPES", "section:finance:read")
-    monkeypatch.setenv("BASE_URL", "https://example.osm.local")
-    monkeypatch.setenv("OSM_BANK_ACCOUNT_ID", "12345")
-
-
 def test_config_builds_urls(env_osm):
     cfg = OSMAuthConfig()  # type: ignore[call-arg]
     assert cfg.token_url == "https://example.osm.local/oauth/token"
@@ -147,3 +135,50 @@ def test_get_token_falls_back_to_interactive_when_needed(monkeypatch, env_osm):
     token = client.get_token(timeout_seconds=7)
     assert called.get("interactive") is True
     assert token == interactive_token
+
+
+def test_token_without_expiry_is_active_without_refresh(monkeypatch, env_osm):
+    token = {"access_token": "t", "token_type": "bearer", "refresh_token": "ref"}
+    store = InMemoryTokenStore()
+    client = OSMClient(token_store=store)
+    client.token = dict(token)  # type: ignore[attr-defined]
+
+    def fail_refresh(*args, **kwargs):
+        raise AssertionError("refresh_token should not be called without expiry")
+
+    monkeypatch.setattr(client, "refresh_token", fail_refresh)
+
+    assert client.ensure_active_token() is True
+    assert client.get_or_refresh_token() == token
+    assert store.get_token() is None
+
+
+def test_get_or_refresh_token_keeps_client_refresh_token_over_dead_store_token(
+    monkeypatch, env_osm
+):
+    now = int(time.time())
+    store = InMemoryTokenStore({"access_token": "stale", "expires_at": now - 100})
+    client = OSMClient(token_store=store)
+    client.token = {  # type: ignore[attr-defined]
+        "access_token": "old",
+        "refresh_token": "ref",
+        "expires_at": now - 10,
+    }
+
+    new_token = {
+        "access_token": "new",
+        "refresh_token": "ref",
+        "expires_at": now + 3600,
+    }
+    used = {}
+
+    def fake_refresh(token_url, refresh_token):
+        used["refresh_token"] = refresh_token
+        client.token = dict(new_token)  # type: ignore[attr-defined]
+        return dict(new_token)
+
+    monkeypatch.setattr(client, "refresh_token", fake_refresh)
+
+    assert client.get_or_refresh_token() == new_token
+    assert used["refresh_token"] == "ref"
+    assert store.get_token() == new_token
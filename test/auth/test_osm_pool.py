@@ -0,0 +1,216 @@
+import multiprocessing
+import os
+import pickle
+import time
+from pathlib import Path
+
+import pytest
+
+from auth.osm import OSMAuthConfig, OSMClient, OSMClientSpec, parallel_map, pool
+from auth.token_store import InMemoryTokenStore, JsonTokenStore
+
+# Patched methods below must reach the workers, so don't spawn fresh interpreters
+FORK = multiprocessing.get_context("fork")
+
+
+def _access_token_and_pid(client, item):
+    return client.token["access_token"], item, os.getpid()
+
+
+def _access_token_after_clock_jump(client, item):
+    flag, _ = item
+    Path(flag).touch()
+    assert client.ensure_active_token()
+    return client.token["access_token"]
+
+
+class _JumpingClock:
+    """Stands in for `time`, jumping two hours ahead once the flag file exists."""
+
+    def __init__(self, flag: Path) -> None:
+        self.flag = flag
+
+    def time(self) -> float:
+        return time.time() + (7200 if self.flag.exists() else 0)
+
+
+@pytest.fixture()
+def refresh_calls(monkeypatch, tmp_path):
+    """Patch refresh on the class so forked workers count into one file."""
+    calls = tmp_path / "refresh_calls"
+    calls.touch()
+
+    def fake_refresh(self, url=None, refresh_token=None, **kwargs):
+        with open(calls, "a") as f:
+            f.write(f"{refresh_token}\n")
+        self.token = {
+            "access_token": "new",
+            "refresh_token": "ref2",
+            "expires_at": int(time.time()) + 86400,
+        }
+        return self.token
+
+    monkeypatch.setattr(OSMClient, "refresh_token", fake_refresh)
+    return calls
+
+
+def test_spec_pickles_without_live_client_or_env(monkeypatch, env_osm):
+    token = {"access_token": "tok", "expires_at": int(time.time()) + 3600}
+    cfg = OSMAuthConfig()  # type: ignore[call-arg]
+    spec = OSMClientSpec(config=cfg, token_store=InMemoryTokenStore(token))
+    spec.client()
+
+    data = pickle.dumps(spec)
+    monkeypatch.delenv("OSM_CLIENT_ID")
+
+    restored = pickle.loads(data)
+    assert restored._client is None
+
+    client = restored.client()
+    assert client.cfg.OSM_CLIENT_ID == "test-client-id"
+    assert client.token == token
+    assert restored.client() is client
+
+
+def test_client_pickles_token_and_settings_not_in_store(env_osm):
+    token = {"access_token": "tok", "expires_at": int(time.time()) + 3600}
+    client = OSMClient(token_store=InMemoryTokenStore())
+    client.token = dict(token)  # type: ignore[attr-defined]
+    client.headers["X-Test"] = "1"
+    client.timeout = 42
+
+    restored = pickle.loads(pickle.dumps(client))
+
+    assert isinstance(restored, OSMClient)
+    assert restored.cfg.BASE_URL == "https://example.osm.local"
+    assert restored.token == token
+    assert restored.headers["X-Test"] == "1"
+    assert restored.timeout.read == 42
+
+
+def test_get_or_refresh_token_adopts_token_refreshed_elsewhere(monkeypatch, env_osm):
+    now = int(time.time())
+    expired = {"access_token": "old", "refresh_token": "ref", "expires_at": now - 10}
+    store = InMemoryTokenStore(expired)
+    client = OSMClient(token_store=store)
+    client.token = dict(expired)  # type: ignore[attr-defined]
+
+    fresh = {"access_token": "new", "refresh_token": "ref2", "expires_at": now + 3600}
+    store.save_token(fresh)
+
+    def fail_refresh(*args, **kwargs):
+        raise AssertionError("refresh_token should not be called")
+
+    monkeypatch.setattr(client, "refresh_token", fail_refresh)
+
+    assert client.get_or_refresh_token() == fresh
+
+
+def test_parallel_map_shares_stored_token_across_workers(tmp_path, env_osm):
+    token = {"access_token": "tok", "expires_at": int(time.time()) + 3600}
+    store = JsonTokenStore(tmp_path / "tok.json")
+    store.save_token(token)
+
+    results = parallel_map(
+        OSMClient(token_store=store),
+        _access_token_and_pid,
+        range(6),
+        max_workers=2,
+    )
+
+    assert [item for _, item, _ in results] == list(range(6))
+    assert {access for access, _, _ in results} == {"tok"}
+    assert os.getpid() not in {pid for _, _, pid in results}
+
+
+def test_parallel_map_ships_token_held_only_on_client(tmp_path, env_osm):
+    client = OSMClient(token_store=JsonTokenStore(tmp_path / "tok.json"))
+    client.token = {  # type: ignore[attr-defined]
+        "access_token": "tok",
+        "expires_at": int(time.time()) + 3600,
+    }
+
+    results = parallel_map(client, _access_token_and_pid, range(2), max_workers=2)
+
+    assert {access for access, _, _ in results} == {"tok"}
+
+
+def test_parallel_map_refreshes_expired_token_in_parent_before_dispatch(
+    tmp_path, env_osm, refresh_calls
+):
+    expired = {"access_token": "old", "refresh_token": "ref", "expires_at": 0}
+    store = JsonTokenStore(tmp_path / "tok.json")
+    store.save_token(expired)
+
+    results = parallel_map(
+        OSMClient(token_store=store),
+        _access_token_and_pid,
+        range(6),
+        max_workers=3,
+        mp_context=FORK,
+    )
+
+    assert {access for access, _, _ in results} == {"new"}
+    assert refresh_calls.read_text().splitlines() == ["ref"]
+
+
+def test_workers_refresh_once_when_token_expires_mid_job(
+    monkeypatch, tmp_path, env_osm, refresh_calls
+):
+    flag = tmp_path / "clock_jumped"
+    monkeypatch.setattr("auth.osm.client.time", _JumpingClock(flag))
+
+    token = {
+        "access_token": "old",
+        "refresh_token": "ref",
+        "expires_at": int(time.time()) + 3600,
+    }
+    store = JsonTokenStore(tmp_path / "tok.json")
+    store.save_token(token)
+
+    results = parallel_map(
+        OSMClient(token_store=store),
+        _access_token_after_clock_jump,
+        [(str(flag), i) for i in range(12)],
+        max_workers=4,
+        mp_context=FORK,
+    )
+
+    assert set(results) == {"new"}
+    assert refresh_calls.read_text().splitlines() == ["ref"]
+    assert store.get_token()["access_token"] == "new"
+
+
+def test_parallel_map_keeps_newer_valid_token_in_store(tmp_path, env_osm):
+    now = int(time.time())
+    newer = {"access_token": "newer", "refresh_token": "ref2", "expires_at": now + 7200}
+    store = JsonTokenStore(tmp_path / "tok.json")
+    store.save_token(newer)
+
+    client = OSMClient(token_store=store)
+    client.token = {  # type: ignore[attr-defined]
+        "access_token": "older",
+        "refresh_token": "ref",
+        "expires_at": now + 3600,
+    }
+
+    results = parallel_map(client, _access_token_and_pid, range(2), max_workers=2)
+
+    assert store.get_token() == newer
+    assert {access for access, _, _ in results} == {"newer"}
+
+
+def test_parallel_map_requires_token(env_osm):
+    with pytest.raises(RuntimeError):
+        parallel_map(
+            OSMClient(token_store=InMemoryTokenStore()), _access_token_and_pid, [1]
+        )
+
+
+def test_worker_without_token_raises_clear_error(monkeypatch, env_osm):
+    cfg = OSMAuthConfig()  # type: ignore[call-arg]
+    spec = OSMClientSpec(config=cfg, token_store=InMemoryTokenStore())
+    monkeypatch.setattr(pool, "_worker_spec", spec)
+
+    with pytest.raises(RuntimeError, match="No valid token available"):
+        pool._call_in_worker(_access_token_and_pid, 1)
@@ -29,3 +29,11 @@ def test_token_store_handles_corrupt_json(tmp_path: Path):
     path.write_text("not-json")
     store = JsonTokenStore(path)
     assert store.get_token() is None
+
+
+def test_token_store_lock_uses_file_beside_token(tmp_path: Path):
+    store = JsonTokenStore(tmp_path / "tok.json")
+    with store.lock():
+        store.save_token({"access_token": "a"})
+    assert (tmp_path / "tok.json.lock").exists()
+    assert store.get_token() == {"access_token": "a"}